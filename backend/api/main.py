@@ -12,6 +12,8 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from temporalio.client import Client
 
+from backend.temporal.converter import msgspec_data_converter
+
 
 logging.basicConfig(
     level=logging.INFO,
@@ -44,6 +46,7 @@ async def lifespan(app: FastAPI):
         temporal_client = await Client.connect(
             temporal_address,
             namespace=temporal_namespace,
+            data_converter=msgspec_data_converter,
         )
         logger.info("✓ Temporal connected")
     except Exception as e:
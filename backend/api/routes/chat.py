@@ -11,21 +11,20 @@ from collections.abc import AsyncGenerator
 from datetime import timedelta
 
 from fastapi import APIRouter, HTTPException, Query
-from sse_starlette.sse import EventSourceResponse
+from sse_starlette.sse import EventSourceResponse, ServerSentEvent
 from temporalio.client import WorkflowExecutionStatus, WorkflowHandle
 from temporalio.exceptions import WorkflowAlreadyStartedError
 
-from backend.temporal.workflows import (
-    ChatRequest,
-    LLMChatWorkflow,
-    StreamState,
-)
+from backend.temporal.workflows import ChatRequest, LLMChatWorkflow
 
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Seconds between SSE keep-alive comments
+SSE_PING_SECONDS = 15
+
 
 async def poll_workflow_stream(
     handle: WorkflowHandle,
@@ -41,13 +40,14 @@ async def poll_workflow_stream(
         timeout: Total timeout in seconds (default: 60s)
 
     Yields:
-        Tokens and status updates from workflow
+        Text received since the previous poll (one message per poll) and
+        status updates from workflow
 
     Raises:
         TimeoutError: If workflow doesn't complete within timeout
         RuntimeError: If workflow fails
     """
-    seen_tokens = 0
+    offset = 0
     last_status = ""
     start_time = asyncio.get_event_loop().time()
 
@@ -67,20 +67,17 @@ async def poll_workflow_stream(
                 )
 
             try:
-                state_dict = await handle.query("get_stream_state")
-                if isinstance(state_dict, dict):
-                    state = StreamState(**state_dict)
-                else:
-                    state = state_dict
+                # Only text past our offset crosses the wire, not the whole transcript
+                state = await handle.query(LLMChatWorkflow.get_stream_update, offset)
             except Exception as e:
                 logger.error(f"Query failed: {e}")
                 raise RuntimeError(f"Failed to query workflow state: {e}")
 
-            new_tokens = state.tokens[seen_tokens:]
-            for token in new_tokens:
-                yield token
+            if state.text:
+                # Everything that arrived since the last poll goes out as one SSE frame
+                yield state.text
 
-            seen_tokens += len(new_tokens)
+            offset = state.next_offset
 
             if state.status != last_status:
                 yield f"__STATUS__: {state.status}"
@@ -92,7 +89,7 @@ async def poll_workflow_stream(
                     raise RuntimeError(f"Workflow failed: {state.error}")
                 else:
                     yield "__DONE__"
-                    logger.info(f"Stream completed: {seen_tokens} tokens")
+                    logger.info(f"Stream completed: {offset} chars")
                     break
 
             await asyncio.sleep(poll_interval)
@@ -119,6 +116,9 @@ async def chat_stream(
     timeout: int = Query(
         60, ge=10, le=300, description="Timeout in seconds (10-300)"
     ),
+    streaming: bool = Query(
+        True, description="Stream partial tokens (false sends the full response at the end)"
+    ),
 ) -> EventSourceResponse:
     """
     Stream chat response via Server-Sent Events.
@@ -132,6 +132,8 @@ async def chat_stream(
         max_tokens: Maximum tokens for LLM to generate
         temperature: Sampling temperature (0.0 = deterministic, 1.0 = creative)
         timeout: Workflow timeout in seconds
+        streaming: Whether to stream partial tokens; when False the response
+            arrives in one message once generation completes
 
     Returns:
         Server-Sent Events stream with LLM tokens and status updates
@@ -187,6 +189,7 @@ async def chat_stream(
                 doc_path=normalized_path,
                 llm_max_tokens=max_tokens,
                 llm_temperature=temperature,
+                streaming=streaming,
             ),
             id=workflow_id,
             task_queue="chat-queue",
@@ -195,27 +198,28 @@ async def chat_stream(
 
         logger.info(f"Workflow started: {workflow_id}")
 
-        async def event_generator() -> AsyncGenerator[str, None]:
+        async def event_generator() -> AsyncGenerator[ServerSentEvent, None]:
             """Generate SSE events from workflow state."""
             try:
                 async for message in poll_workflow_stream(
                     handle, poll_interval=0.15, timeout=timeout
                 ):
-                    yield message
+                    yield ServerSentEvent(data=message)
 
             except TimeoutError as e:
                 logger.error(f"Timeout: {e}")
-                yield f"__ERROR__: {e}"
+                yield ServerSentEvent(data=f"__ERROR__: {e}")
 
             except RuntimeError as e:
                 logger.error(f"Runtime error: {e}")
-                yield f"__ERROR__: {e}"
+                yield ServerSentEvent(data=f"__ERROR__: {e}")
 
             except Exception as e:
                 logger.error(f"Stream error: {e}")
-                yield f"__ERROR__: {e}"
+                yield ServerSentEvent(data=f"__ERROR__: {e}")
 
-        return EventSourceResponse(event_generator())
+        # Keep-alive pings stop proxies from closing the stream during long completions
+        return EventSourceResponse(event_generator(), ping=SSE_PING_SECONDS)
 
     except WorkflowAlreadyStartedError:
         raise HTTPException(
@@ -257,11 +261,7 @@ async def get_workflow_status(workflow_id: str):
         state = None
         if desc.status == WorkflowExecutionStatus.RUNNING:
             try:
-                state_dict = await handle.query("get_stream_state")
-                if isinstance(state_dict, dict):
-                    state = StreamState(**state_dict)
-                else:
-                    state = state_dict
+                state = await handle.query(LLMChatWorkflow.get_stream_state)
             except Exception as e:
                 logger.warning(f"Failed to query state: {e}")
 
@@ -271,7 +271,7 @@ async def get_workflow_status(workflow_id: str):
             "start_time": desc.start_time.isoformat() if desc.start_time else None,
             "close_time": desc.close_time.isoformat() if desc.close_time else None,
             "stream_state": {
-                "tokens_count": len(state.tokens) if state else 0,
+                "tokens_count": state.token_count if state else 0,
                 "status": state.status if state else None,
                 "completed": state.completed if state else False,
                 "error": state.error if state else None,
@@ -1,12 +1,14 @@
 """Document processors for text, PDF, and image files."""
 
-from .pdf_reader import PDFReadError, read_pdf_file
-from .text_reader import TextReadError, read_text_file
+from .pdf_reader import PDFReadError, read_pdf_file, read_pdf_file_async
+from .text_reader import TextReadError, read_text_file, read_text_file_async
 
 
 __all__ = [
     "PDFReadError",
     "TextReadError",
     "read_pdf_file",
+    "read_pdf_file_async",
     "read_text_file",
+    "read_text_file_async",
 ]
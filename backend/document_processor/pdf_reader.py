@@ -1,17 +1,206 @@
 """PDF file reader with text extraction."""
 
+import asyncio
+import io
+import multiprocessing
+import os
+import threading
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 
 import pdfplumber
+import pymupdf
 import pypdf
 
 
+# Below this page count the pool round-trip costs more than it saves
+MIN_PAGES_FOR_POOL = 4
+
+_pool: ProcessPoolExecutor | None = None
+_pool_lock = threading.Lock()
+
+
 class PDFReadError(Exception):
     """Raised when PDF cannot be read."""
 
     pass
 
 
+def _get_pool() -> ProcessPoolExecutor:
+    """
+    Return the shared page-extraction process pool, creating it on first use.
+
+    Workers are spawned rather than forked: the Temporal worker runs native
+    threads, which are not safe to fork.
+    """
+    global _pool
+
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(
+                max_workers=os.cpu_count(),
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _pool
+
+
+def _discard_pool(pool: ProcessPoolExecutor) -> None:
+    """
+    Drop the shared pool if it is still the given instance.
+
+    Args:
+        pool: Pool that became unusable
+    """
+    global _pool
+
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _extract_pages(
+    extract_range: Callable[[str, int, int], list[tuple[int, str]]],
+    file_path: Path,
+    page_count: int,
+) -> list[tuple[int, str]]:
+    """
+    Extract all pages, fanning out to the process pool for larger documents.
+
+    Each pool task covers a contiguous page range so a worker parses the
+    document once per range rather than once per page.
+
+    Args:
+        extract_range: Module-level callable returning (page_index, text) for a range
+        file_path: Path to PDF file
+        page_count: Number of pages in the document
+
+    Returns:
+        List of (page_index, text) tuples in page order
+    """
+    path = str(file_path)
+
+    if page_count < MIN_PAGES_FOR_POOL:
+        return extract_range(path, 0, page_count)
+
+    pool = _get_pool()
+    step = -(-page_count // min(os.cpu_count() or 1, page_count))
+    starts = range(0, page_count, step)
+    stops = [min(start + step, page_count) for start in starts]
+
+    try:
+        chunks = pool.map(extract_range, [path] * len(starts), starts, stops)
+        return [page for chunk in chunks for page in chunk]
+    except BrokenProcessPool:
+        # A crashed worker leaves the pool unusable; let the next call start a fresh one
+        _discard_pool(pool)
+        raise
+
+
+def _extract_page_range(path: str, start: int, stop: int) -> list[tuple[int, str]]:
+    """
+    Extract text from a range of pages with pypdf (process pool worker).
+
+    Args:
+        path: Path to PDF file
+        start: First zero-based page index
+        stop: Page index to stop before
+
+    Returns:
+        List of (page_index, text); text is an error marker if a page fails
+    """
+    reader = pypdf.PdfReader(path)
+    results = []
+
+    for idx in range(start, stop):
+        try:
+            results.append((idx, reader.pages[idx].extract_text() or ""))
+        except Exception as e:
+            # Report page error but continue processing remaining pages
+            results.append((idx, f"[Error extracting text: {e}]"))
+
+    return results
+
+
+def _extract_page_range_pdfplumber(path: str, start: int, stop: int) -> list[tuple[int, str]]:
+    """
+    Extract text from a range of pages with pdfplumber (process pool worker).
+
+    Args:
+        path: Path to PDF file
+        start: First zero-based page index
+        stop: Page index to stop before
+
+    Returns:
+        List of (page_index, text); text is an error marker if a page fails
+    """
+    results = []
+
+    with pdfplumber.open(path) as pdf:
+        for idx in range(start, stop):
+            try:
+                results.append((idx, pdf.pages[idx].extract_text() or ""))
+            except Exception as e:
+                results.append((idx, f"[Error: {e}]"))
+
+    return results
+
+
+def _format_pages(pages: Iterable[tuple[int, str]]) -> str:
+    """
+    Format extracted pages as '--- Page N ---' sections separated by blank lines.
+
+    Pages without text are skipped. Sections are written into a single
+    buffer instead of building and joining a list of per-page strings.
+
+    Args:
+        pages: (page_index, text) tuples in page order
+
+    Returns:
+        Formatted document text
+    """
+    buf = io.StringIO()
+
+    for idx, text in pages:
+        if not text or not text.strip():
+            continue
+        if buf.tell():
+            buf.write("\n\n")
+        buf.write("--- Page ")
+        buf.write(str(idx + 1))
+        buf.write(" ---\n")
+        buf.write(text)
+
+    return buf.getvalue()
+
+
+def _probe_has_text(reader: pypdf.PdfReader, page_count: int) -> bool:
+    """
+    Check whether the first or middle page has extractable text.
+
+    Args:
+        reader: Open pypdf reader
+        page_count: Number of pages in the document
+
+    Returns:
+        True if a probed page has text (or fails to extract, so the full pass decides)
+    """
+    probe_indices = {0, page_count // 2} if page_count else set()
+
+    for idx in sorted(probe_indices):
+        try:
+            text = reader.pages[idx].extract_text()
+        except Exception:
+            return True
+        if text and text.strip():
+            return True
+
+    return False
+
+
 def read_pdf_file(
     file_path: Path,
     max_size_mb: int = 10,
@@ -20,6 +209,9 @@ def read_pdf_file(
     """
     Read and extract text from PDF file.
 
+    Tries PyMuPDF first, then pypdf (pages extracted in parallel across a
+    shared process pool), then pdfplumber.
+
     Args:
         file_path: Path to PDF file
         max_size_mb: Maximum file size in megabytes
@@ -43,26 +235,33 @@ def read_pdf_file(
     if size_mb > max_size_mb:
         raise PDFReadError(f"PDF too large: {size_mb:.2f}MB (max: {max_size_mb}MB)")
 
-    # Try pypdf first because it's faster
+    # Try PyMuPDF first: native MuPDF bindings, much faster than pure-Python parsers
     try:
-        text_parts = []
+        extracted_text = _read_pdf_with_pymupdf(file_path)
+        if extracted_text.strip():
+            return extracted_text
+    except PDFReadError:
+        raise
+    except Exception:
+        # Fall through to the pure-Python extractors
+        pass
 
+    try:
         with open(file_path, "rb") as f:
             reader = pypdf.PdfReader(f)
 
             if reader.is_encrypted:
                 raise PDFReadError("PDF is encrypted")
 
-            for page_num, page in enumerate(reader.pages, start=1):
-                try:
-                    text = page.extract_text()
-                    if text and text.strip():
-                        text_parts.append(f"--- Page {page_num} ---\n{text}")
-                except Exception as e:
-                    # Log page error but continue processing remaining pages
-                    text_parts.append(f"--- Page {page_num} ---\n[Error extracting text: {e}]")
+            page_count = len(reader.pages)
+
+            # Scanned/image-only PDFs yield no text from pypdf; sample a couple of
+            # pages to jump straight to pdfplumber. Without that fallback the full
+            # pass below must run, since only the sampled pages may be blank.
+            if use_pdfplumber_fallback and not _probe_has_text(reader, page_count):
+                return _read_pdf_with_pdfplumber(file_path)
 
-        extracted_text = "\n\n".join(text_parts)
+        extracted_text = _format_pages(_extract_pages(_extract_page_range, file_path, page_count))
 
         if not extracted_text.strip():
             if use_pdfplumber_fallback:
@@ -86,6 +285,65 @@ def read_pdf_file(
             raise PDFReadError(f"Failed to read PDF: {e}")
 
 
+async def read_pdf_file_async(
+    file_path: Path,
+    max_size_mb: int = 10,
+    use_pdfplumber_fallback: bool = True,
+) -> str:
+    """
+    Run read_pdf_file in a worker thread so the event loop stays responsive.
+
+    Args:
+        file_path: Path to PDF file
+        max_size_mb: Maximum file size in megabytes
+        use_pdfplumber_fallback: If True, use pdfplumber if pypdf fails
+
+    Returns:
+        Extracted text content
+
+    Raises:
+        PDFReadError: If PDF cannot be read or is too large
+    """
+    return await asyncio.to_thread(read_pdf_file, file_path, max_size_mb, use_pdfplumber_fallback)
+
+
+def _read_pdf_with_pymupdf(file_path: Path) -> str:
+    """
+    Read PDF using PyMuPDF (primary method).
+
+    Args:
+        file_path: Path to PDF file
+
+    Returns:
+        Extracted text content (empty if the PDF has no text layer)
+
+    Raises:
+        PDFReadError: If PDF is encrypted
+    """
+    with pymupdf.open(file_path) as doc:
+        if doc.needs_pass:
+            raise PDFReadError("PDF is encrypted")
+
+        return _format_pages(_iter_pymupdf_pages(doc))
+
+
+def _iter_pymupdf_pages(doc: pymupdf.Document) -> Iterator[tuple[int, str]]:
+    """
+    Yield text of each page of an open PyMuPDF document.
+
+    Args:
+        doc: Open PyMuPDF document
+
+    Yields:
+        Tuples of (page_index, text); text is an error marker if a page fails
+    """
+    for idx, page in enumerate(doc):
+        try:
+            yield idx, page.get_text("text")
+        except Exception as e:
+            yield idx, f"[Error extracting text: {e}]"
+
+
 def _read_pdf_with_pdfplumber(file_path: Path) -> str:
     """
     Read PDF using pdfplumber (fallback method).
@@ -100,18 +358,12 @@ def _read_pdf_with_pdfplumber(file_path: Path) -> str:
         PDFReadError: If extraction fails
     """
     try:
-        text_parts = []
-
         with pdfplumber.open(file_path) as pdf:
-            for page_num, page in enumerate(pdf.pages, start=1):
-                try:
-                    text = page.extract_text()
-                    if text and text.strip():
-                        text_parts.append(f"--- Page {page_num} ---\n{text}")
-                except Exception as e:
-                    text_parts.append(f"--- Page {page_num} ---\n[Error: {e}]")
-
-        extracted_text = "\n\n".join(text_parts)
+            page_count = len(pdf.pages)
+
+        extracted_text = _format_pages(
+            _extract_pages(_extract_page_range_pdfplumber, file_path, page_count)
+        )
 
         if not extracted_text.strip():
             raise PDFReadError("No text extracted (pdfplumber)")
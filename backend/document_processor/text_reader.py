@@ -1,10 +1,25 @@
 """Text file reader with encoding detection."""
 
+import asyncio
+import codecs
 from pathlib import Path
 
 import chardet
 
 
+# Leading bytes fed to the encoding detector; enough to classify real-world text
+DETECTION_SAMPLE_SIZE = 16 * 1024
+
+# UTF-32 LE must be checked before UTF-16 LE: its BOM starts with the same two bytes
+_BOM_ENCODINGS = (
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+
+
 class TextReadError(Exception):
     """Raised when text file cannot be read."""
 
@@ -19,6 +34,9 @@ def read_text_file(
     """
     Read text file with automatic encoding detection.
 
+    The encoding is detected from the first DETECTION_SAMPLE_SIZE bytes only,
+    so detection cost does not grow with file size.
+
     Args:
         file_path: Path to text file
         max_size_mb: Maximum file size in megabytes
@@ -48,18 +66,98 @@ def read_text_file(
                 content = f.read()
         else:
             with open(file_path, "rb") as f:
-                raw_data = f.read()
+                raw_head = f.read(DETECTION_SAMPLE_SIZE)
 
-            detected = chardet.detect(raw_data)
-            detected_encoding = detected.get("encoding", "utf-8")
+            detected_encoding = _detect_encoding(raw_head)
 
+            # Decode while reading instead of holding a raw bytes copy;
+            # newline="" keeps line endings exactly as stored on disk
             try:
-                content = raw_data.decode(detected_encoding)
-            except (UnicodeDecodeError, TypeError):
-                # Fallback to UTF-8 replacing invalid characters
-                content = raw_data.decode("utf-8", errors="replace")
+                with open(file_path, encoding=detected_encoding, newline="") as f:
+                    content = f.read()
+            except (UnicodeDecodeError, LookupError):
+                # The head was not representative; detect on the whole file
+                content = _decode_with_full_detection(file_path.read_bytes())
 
         return content
 
     except Exception as e:
         raise TextReadError(f"Failed to read file: {e}")
+
+
+async def read_text_file_async(
+    file_path: Path,
+    max_size_mb: int = 10,
+    encoding: str | None = None,
+) -> str:
+    """
+    Run read_text_file in a worker thread so the event loop stays responsive.
+
+    Args:
+        file_path: Path to text file
+        max_size_mb: Maximum file size in megabytes
+        encoding: Explicit encoding (if None, auto-detect)
+
+    Returns:
+        File contents as string
+
+    Raises:
+        TextReadError: If file cannot be read or is too large
+    """
+    return await asyncio.to_thread(read_text_file, file_path, max_size_mb, encoding)
+
+
+def _detect_encoding(raw_head: bytes) -> str:
+    """
+    Detect encoding from leading bytes, skipping chardet for the common cases.
+
+    Args:
+        raw_head: Leading bytes of the file
+
+    Returns:
+        Codec name (BOM-aware codecs strip the BOM when decoding)
+    """
+    for bom, bom_encoding in _BOM_ENCODINGS:
+        if raw_head.startswith(bom):
+            return bom_encoding
+
+    # NUL bytes point to BOM-less UTF-16/32, which also decode as UTF-8
+    if b"\x00" not in raw_head:
+        # ASCII is a subset of UTF-8
+        if raw_head.isascii():
+            return "utf-8"
+        # The head may cut a multi-byte sequence short, so decode it non-final;
+        # chardet misreads such a truncated tail as cp1252/latin-1
+        try:
+            codecs.getincrementaldecoder("utf-8")().decode(raw_head, final=False)
+        except UnicodeDecodeError:
+            pass
+        else:
+            return "utf-8"
+
+    detected = chardet.detect(raw_head)
+    return detected.get("encoding") or "utf-8"
+
+
+def _decode_with_full_detection(raw: bytes) -> str:
+    """
+    Decode using chardet on the full content, falling back to lossy UTF-8.
+
+    Used when the encoding detected from the leading bytes fails later in
+    the file.
+
+    Args:
+        raw: Full file contents
+
+    Returns:
+        Decoded text (line endings preserved)
+    """
+    detected = chardet.detect(raw).get("encoding")
+    if detected:
+        try:
+            return raw.decode(detected)
+        except (UnicodeDecodeError, LookupError):
+            pass
+
+    # Fallback to UTF-8 replacing invalid characters
+    return raw.decode("utf-8", errors="replace")
@@ -4,6 +4,17 @@ from abc import ABC, abstractmethod
 from collections.abc import AsyncGenerator
 from dataclasses import dataclass
 
+import httpx
+
+
+# SDK default pool sizes, but idle connections are kept for 90s instead of 5s
+# so consecutive chat turns reuse the TLS connection to the provider
+HTTP_POOL_LIMITS = httpx.Limits(
+    max_connections=1000,
+    max_keepalive_connections=100,
+    keepalive_expiry=90,
+)
+
 
 @dataclass
 class StreamChunk:
@@ -4,7 +4,7 @@ from collections.abc import AsyncGenerator
 
 import anthropic
 
-from .base import BaseLLMAdapter, StreamChunk
+from .base import HTTP_POOL_LIMITS, BaseLLMAdapter, StreamChunk
 
 
 class ClaudeAdapter(BaseLLMAdapter):
@@ -18,7 +18,10 @@ class ClaudeAdapter(BaseLLMAdapter):
             api_key: Anthropic API key
             model: Claude model identifier
         """
-        self.client = anthropic.AsyncAnthropic(api_key=api_key)
+        self.client = anthropic.AsyncAnthropic(
+            api_key=api_key,
+            http_client=anthropic.DefaultAsyncHttpxClient(limits=HTTP_POOL_LIMITS),
+        )
         self.model = model
 
     async def stream_completion(
@@ -1,5 +1,6 @@
 """Factory for creating LLM adapter instances."""
 
+import functools
 import os
 
 from .base import BaseLLMAdapter
@@ -21,6 +22,9 @@ def create_llm_adapter(
     """
     Create LLM adapter based on provider selection.
 
+    Adapters are memoized per (provider, api_key, model), so callers share
+    one client and its connection pool.
+
     Args:
         provider: Provider name ('claude' or 'openai'). If None, reads from LLM_PROVIDER env var.
         api_key: API key for provider. If None, reads from provider-specific env var.
@@ -60,7 +64,29 @@ def create_llm_adapter(
     if not api_key:
         raise LLMProviderError(config["error_msg"])
 
-    adapter_class = config["adapter_class"]
+    return _build_adapter(config["adapter_class"], api_key, model)
+
+
+@functools.lru_cache(maxsize=16)
+def _build_adapter(
+    adapter_class: type[BaseLLMAdapter],
+    api_key: str,
+    model: str | None,
+) -> BaseLLMAdapter:
+    """
+    Build adapter, reusing the instance for identical configuration.
+
+    Sharing the adapter shares its SDK client and HTTP connection pool, so
+    repeated calls don't pay a new TLS handshake.
+
+    Args:
+        adapter_class: Adapter class for the provider
+        api_key: API key for provider
+        model: Model identifier, or None for provider default
+
+    Returns:
+        Configured LLM adapter instance
+    """
     if model:
         return adapter_class(api_key=api_key, model=model)
     return adapter_class(api_key=api_key)
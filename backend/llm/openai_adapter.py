@@ -4,7 +4,7 @@ from collections.abc import AsyncGenerator
 
 import openai
 
-from .base import BaseLLMAdapter, StreamChunk
+from .base import HTTP_POOL_LIMITS, BaseLLMAdapter, StreamChunk
 
 
 class OpenAIAdapter(BaseLLMAdapter):
@@ -18,7 +18,10 @@ class OpenAIAdapter(BaseLLMAdapter):
             api_key: OpenAI API key
             model: OpenAI model identifier
         """
-        self.client = openai.AsyncOpenAI(api_key=api_key)
+        self.client = openai.AsyncOpenAI(
+            api_key=api_key,
+            http_client=openai.DefaultAsyncHttpxClient(limits=HTTP_POOL_LIMITS),
+        )
         self.model = model
 
     async def stream_completion(
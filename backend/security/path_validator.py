@@ -7,6 +7,11 @@ Guards against:
 - Access outside whitelisted directories
 """
 
+import os
+import stat
+import threading
+import time
+from collections import OrderedDict
 from pathlib import Path
 
 
@@ -19,6 +24,10 @@ class PathValidationError(Exception):
 class PathValidator:
     """Validates paths against whitelist and security rules."""
 
+    # Resolved paths are reused briefly, and only while the target's stat is unchanged
+    CACHE_SIZE = 512
+    CACHE_TTL_SECONDS = 5.0
+
     def __init__(self, allowed_base: str = "/documents"):
         """
         Initialize validator with allowed base directory.
@@ -27,17 +36,40 @@ class PathValidator:
             allowed_base: Base directory that all paths must be within
         """
         self.allowed_base = Path(allowed_base).expanduser().resolve()
+        self._cache: OrderedDict[str, tuple[Path, int, int, float]] = OrderedDict()
+        self._cache_lock = threading.Lock()
 
     def validate(self, user_path: str) -> Path:
         """
         Validate and resolve path, ensuring it's within allowed base.
 
+        Successful resolutions of existing paths are cached for
+        CACHE_TTL_SECONDS; a cache hit costs a single stat() to confirm the
+        target's mtime and size are unchanged.
+
         Args:
             user_path: User-provided path (relative or absolute)
 
         Returns:
             Resolved absolute Path object
 
+        Raises:
+            PathValidationError: If path is invalid or outside allowed base
+        """
+        resolved_path, _ = self._validate_and_stat(user_path)
+        return resolved_path
+
+    def _validate_and_stat(self, user_path: str) -> tuple[Path, os.stat_result | None]:
+        """
+        Validate and resolve path, also returning the stat result gathered on the way.
+
+        Args:
+            user_path: User-provided path (relative or absolute)
+
+        Returns:
+            Tuple of resolved absolute Path object and its stat result, or None
+            when the path does not exist or was reached through a symlink
+
         Raises:
             PathValidationError: If path is invalid or outside allowed base
         """
@@ -47,6 +79,10 @@ class PathValidator:
         if "\x00" in user_path:
             raise PathValidationError("Path contains null bytes")
 
+        cached = self._get_cached(user_path)
+        if cached is not None:
+            return cached
+
         try:
             # Reject tilde paths - not applicable in container context
             if user_path.startswith("~"):
@@ -84,17 +120,84 @@ class PathValidator:
                 f"Path '{user_path}' is outside allowed directory '{self.allowed_base}'"
             )
 
-        if resolved_path.exists():
+        try:
+            st = os.lstat(resolved_path)
+        except OSError:
+            return resolved_path, None
+
+        # resolve() above already followed every existing symlink, so only a link that
+        # is still in place (e.g. swapped in concurrently) needs the strict re-resolve
+        # lstat() equals stat() for anything that is not a symlink
+        if not stat.S_ISLNK(st.st_mode):
+            self._store_cached(user_path, resolved_path, st)
+            return resolved_path, st
+
+        try:
             # Re-resolve with strict=True to catch symlinks pointing outside allowed base
             real_path = resolved_path.resolve(strict=True)
+        except OSError:
+            # Dangling link: nothing to escape to, same as a missing path
+            return resolved_path, None
+
+        try:
+            real_path.relative_to(self.allowed_base)
+        except ValueError:
+            raise PathValidationError(
+                f"Symlink escape detected: '{user_path}' points to '{real_path}'"
+            )
+
+        return resolved_path, None
+
+    def _get_cached(self, user_path: str) -> tuple[Path, os.stat_result] | None:
+        """
+        Return cached resolution if still fresh and the target is unchanged.
+
+        Args:
+            user_path: User-provided path used as cache key
+
+        Returns:
+            Tuple of cached resolved Path and its fresh stat result, or None on miss
+        """
+        with self._cache_lock:
+            entry = self._cache.get(user_path)
+
+        if entry is None:
+            return None
+
+        path, mtime_ns, size, expires_at = entry
+
+        if time.monotonic() < expires_at:
             try:
-                real_path.relative_to(self.allowed_base)
-            except ValueError:
-                raise PathValidationError(
-                    f"Symlink escape detected: '{user_path}' points to '{real_path}'"
-                )
+                st = os.stat(path)
+            except OSError:
+                st = None
 
-        return resolved_path
+            if st is not None and st.st_mtime_ns == mtime_ns and st.st_size == size:
+                with self._cache_lock:
+                    if user_path in self._cache:
+                        self._cache.move_to_end(user_path)
+                return path, st
+
+        with self._cache_lock:
+            self._cache.pop(user_path, None)
+        return None
+
+    def _store_cached(self, user_path: str, path: Path, st: os.stat_result) -> None:
+        """
+        Cache a validated resolution, evicting the least recently used entry.
+
+        Args:
+            user_path: User-provided path used as cache key
+            path: Validated, resolved path
+            st: Stat result of the resolved path
+        """
+        expires_at = time.monotonic() + self.CACHE_TTL_SECONDS
+
+        with self._cache_lock:
+            self._cache[user_path] = (path, st.st_mtime_ns, st.st_size, expires_at)
+            self._cache.move_to_end(user_path)
+            if len(self._cache) > self.CACHE_SIZE:
+                self._cache.popitem(last=False)
 
     def validate_file(self, user_path: str, max_size_mb: int = 10) -> Path:
         """
@@ -110,21 +213,46 @@ class PathValidator:
         Raises:
             PathValidationError: If validation fails or file too large
         """
-        file_path = self.validate(user_path)
+        file_path, _ = self.validate_file_and_stat(user_path, max_size_mb)
+        return file_path
+
+    def validate_file_and_stat(
+        self, user_path: str, max_size_mb: int = 10
+    ) -> tuple[Path, os.stat_result]:
+        """
+        Validate file path and check size limits, returning the stat result.
+
+        Reuses the stat result from path validation for the existence, type
+        and size checks, stat-ing again only when the path went through a
+        symlink or did not exist, so callers can reuse it as well.
+
+        Args:
+            user_path: User-provided file path
+            max_size_mb: Maximum allowed file size in megabytes
+
+        Returns:
+            Tuple of validated Path object and its stat result
+
+        Raises:
+            PathValidationError: If validation fails or file too large
+        """
+        file_path, st = self._validate_and_stat(user_path)
 
-        if not file_path.exists():
-            raise PathValidationError(f"File does not exist: '{user_path}'")
+        if st is None:
+            try:
+                st = os.stat(file_path)
+            except (FileNotFoundError, NotADirectoryError):
+                raise PathValidationError(f"File does not exist: '{user_path}'")
 
-        if not file_path.is_file():
+        if not stat.S_ISREG(st.st_mode):
             raise PathValidationError(f"Path is not a regular file: '{user_path}'")
 
-        size_bytes = file_path.stat().st_size
-        size_mb = size_bytes / (1024 * 1024)
+        size_mb = st.st_size / (1024 * 1024)
 
         if size_mb > max_size_mb:
             raise PathValidationError(f"File too large: {size_mb:.2f}MB (max: {max_size_mb}MB)")
 
-        return file_path
+        return file_path, st
 
     def validate_directory(self, user_path: str) -> Path:
         """
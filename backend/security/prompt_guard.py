@@ -8,7 +8,101 @@ Protects against:
 - Role confusion attacks
 """
 
+import functools
+import io
 import re
+import threading
+from collections.abc import Iterable
+
+
+try:
+    import hyperscan
+except ImportError:  # Optional accelerator; the plain regex scan is used without it
+    hyperscan = None
+
+try:
+    import ahocorasick
+except ImportError:  # Optional literal prefilter, used when hyperscan is unavailable
+    ahocorasick = None
+
+
+# Python's str-pattern \s also matches the ASCII separators \x1c-\x1f
+_HYPERSCAN_WHITESPACE = rb"[\t\n\x0b\x0c\r\x1c-\x1f ]"
+
+_hyperscan_local = threading.local()
+
+
+@functools.cache
+def _build_hyperscan_database(patterns: tuple[str, ...]):
+    """
+    Compile all patterns into a single Hyperscan block-mode database.
+
+    Args:
+        patterns: Regex sources, compiled with ids matching their positions
+
+    Returns:
+        Hyperscan Database, or None if the patterns are not supported
+    """
+    expressions = [p.encode().replace(rb"\s", _HYPERSCAN_WHITESPACE) for p in patterns]
+    db = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+
+    try:
+        db.compile(
+            expressions=expressions,
+            ids=list(range(len(expressions))),
+            elements=len(expressions),
+            flags=hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH,
+        )
+    except hyperscan.error:
+        return None
+
+    return db
+
+
+def _hyperscan_match_ids(db, text: str) -> set[int]:
+    """
+    Scan ASCII text once and return ids of all patterns that matched.
+
+    Args:
+        db: Database from _build_hyperscan_database
+        text: ASCII-only text to scan
+
+    Returns:
+        Set of matching pattern ids
+    """
+    # Scratch space is not thread-safe, so keep one per thread and database
+    scratches = getattr(_hyperscan_local, "scratches", None)
+    if scratches is None:
+        scratches = _hyperscan_local.scratches = {}
+    scratch = scratches.get(id(db))
+    if scratch is None:
+        scratch = scratches[id(db)] = hyperscan.Scratch(db)
+
+    matched: set[int] = set()
+
+    def on_match(pattern_id, start, end, flags, context):
+        matched.add(pattern_id)
+
+    db.scan(text.encode("ascii"), match_event_handler=on_match, scratch=scratch)
+    return matched
+
+
+@functools.cache
+def _build_anchor_automaton(anchors: tuple[str, ...]):
+    """
+    Build an Aho-Corasick automaton over lowercase pattern anchors.
+
+    Args:
+        anchors: Distinct lowercase literals to search for
+
+    Returns:
+        Automaton whose matches yield (end_index, anchor)
+    """
+    automaton = ahocorasick.Automaton()
+    for anchor in anchors:
+        automaton.add_word(anchor, anchor)
+    automaton.make_automaton()
+    return automaton
 
 
 class PromptInjectionError(Exception):
@@ -45,6 +139,51 @@ class PromptGuard:
         (r"what\s+(are|were)\s+your\s+(original\s+)?(instructions|rules)", "prompt leakage"),
     ]
 
+    # Lowercase literal that every match of the pattern contains. Without hyperscan,
+    # a pattern is only run when its anchor occurs in the input; an anchor that is
+    # the whole pattern is matched by the Aho-Corasick automaton alone.
+    PATTERN_ANCHORS = {
+        r"ignore\s+(all\s+)?(previous|prior|above)\s+instructions?": "ignore",
+        r"disregard\s+(all\s+)?(previous|prior|above)": "disregard",
+        r"forget\s+(all\s+)?(previous|prior|above)": "forget",
+        r"system\s*:": "system",
+        r"<\|im_start\|>": "<|im_start|>",
+        r"<\|im_end\|>": "<|im_end|>",
+        r"###\s*system": "###",
+        r"you\s+are\s+now": "now",
+        r"act\s+as\s+(if\s+)?you\s+(are|were)": "act",
+        r"pretend\s+you\s+are": "pretend",
+        r"developer\s+mode": "developer",
+        r"DAN\s+mode": "mode",
+        r"sudo\s+mode": "sudo",
+        r"print\s+your\s+(system\s+)?(prompt|instructions)": "print",
+        r"show\s+me\s+your\s+(system\s+)?(prompt|instructions)": "show",
+        r"what\s+(are|were)\s+your\s+(original\s+)?(instructions|rules)": "what",
+    }
+
+    # Compiled once at import; shared by every guard instance
+    _COMPILED_PATTERNS = [
+        (re.compile(pattern, re.IGNORECASE), desc) for pattern, desc in DANGEROUS_PATTERNS
+    ]
+
+    # Prefilter tables; like the compiled patterns, they depend only on the class
+    # constants, so they are built once and every instance just binds them
+    _PATTERN_ANCHOR_LIST = list(map(PATTERN_ANCHORS.get, (p for p, _ in DANGEROUS_PATTERNS)))
+    _LITERAL_PATTERN_IDS = frozenset(
+        i
+        for i, ((pattern, _), anchor) in enumerate(
+            zip(DANGEROUS_PATTERNS, _PATTERN_ANCHOR_LIST, strict=True)
+        )
+        if anchor is not None and re.escape(anchor) == pattern.lower()
+    )
+    _PATTERN_SOURCES = tuple(pattern for pattern, _ in DANGEROUS_PATTERNS)
+    _ANCHOR_WORDS = tuple(sorted({a for a in _PATTERN_ANCHOR_LIST if a}))
+
+    # Single-pass escaping for sanitize():
+    # - XML-like tags used in Claude prompt structure
+    # - backticks, to prevent markdown code block injection
+    _SANITIZE_TABLE = str.maketrans({"<": "&lt;", ">": "&gt;", "`": "\\`"})
+
     def __init__(self, strict_mode: bool = True):
         """
         Initialize prompt guard.
@@ -54,14 +193,49 @@ class PromptGuard:
                         If False, only reject high-confidence injections.
         """
         self.strict_mode = strict_mode
-        self.compiled_patterns = [
-            (re.compile(pattern, re.IGNORECASE), desc) for pattern, desc in self.DANGEROUS_PATTERNS
-        ]
+        self.compiled_patterns = self._COMPILED_PATTERNS
+        self.pattern_anchors = self._PATTERN_ANCHOR_LIST
+        self.literal_pattern_ids = self._LITERAL_PATTERN_IDS
+
+    @property
+    def hyperscan_db(self):
+        """
+        Hyperscan database for DANGEROUS_PATTERNS, compiled on first use.
+
+        Compiling is deferred so importing this module (e.g. in a workflow
+        sandbox) stays cheap; the builder's cache makes it a one-time cost.
+
+        Returns:
+            Compiled database, or None if hyperscan is unavailable
+        """
+        if hyperscan is None:
+            return None
+        return _build_hyperscan_database(self._PATTERN_SOURCES)
+
+    @property
+    def anchor_automaton(self):
+        """
+        Aho-Corasick automaton over the pattern anchors, built on first use.
+
+        Returns:
+            Automaton, or None if pyahocorasick is unavailable or hyperscan is used
+        """
+        if ahocorasick is None or self.hyperscan_db is not None:
+            return None
+        return _build_anchor_automaton(self._ANCHOR_WORDS)
 
     def scan(self, user_input: str) -> list[tuple[str, str]]:
         """
         Scan input for injection patterns.
 
+        When Hyperscan is available, ASCII input is matched against all
+        patterns in one pass and only the patterns that hit are re-run with
+        `re` to extract the matched text. Otherwise, if pyahocorasick is
+        available, one literal pass finds which pattern anchors occur and
+        only those patterns are run. Non-ASCII input always takes the full
+        regex path, since both prefilters match case and \\s ASCII-only
+        while Python's `re` is Unicode-aware.
+
         Args:
             user_input: User-provided text to scan
 
@@ -71,15 +245,60 @@ class PromptGuard:
         if not user_input or not user_input.strip():
             return []
 
+        candidate_ids = range(len(self.compiled_patterns))
+        literal_matches: dict[int, str] = {}
+
+        if user_input.isascii():
+            hyperscan_db = self.hyperscan_db
+            if hyperscan_db is not None:
+                candidate_ids = sorted(_hyperscan_match_ids(hyperscan_db, user_input))
+            elif self.anchor_automaton is not None:
+                candidate_ids, literal_matches = self._prefilter_by_anchors(user_input)
+
         detections = []
 
-        for pattern, description in self.compiled_patterns:
+        for i in candidate_ids:
+            pattern, description = self.compiled_patterns[i]
+
+            if i in literal_matches:
+                detections.append((literal_matches[i], description))
+                continue
+
             match = pattern.search(user_input)
             if match:
                 detections.append((match.group(0), description))
 
         return detections
 
+    def _prefilter_by_anchors(self, user_input: str) -> tuple[list[int], dict[int, str]]:
+        """
+        Select patterns worth running from one Aho-Corasick pass over ASCII input.
+
+        Args:
+            user_input: ASCII-only text to scan
+
+        Returns:
+            Tuple of (candidate pattern ids in order, {id: matched text} for
+            literal patterns, which need no regex pass)
+        """
+        first_end: dict[str, int] = {}
+        for end, anchor in self.anchor_automaton.iter(user_input.lower()):
+            first_end.setdefault(anchor, end)
+
+        candidate_ids = []
+        literal_matches = {}
+
+        for i, anchor in enumerate(self.pattern_anchors):
+            if anchor is None:
+                candidate_ids.append(i)
+            elif anchor in first_end:
+                candidate_ids.append(i)
+                if i in self.literal_pattern_ids:
+                    end = first_end[anchor]
+                    literal_matches[i] = user_input[end - len(anchor) + 1 : end + 1]
+
+        return candidate_ids, literal_matches
+
     def validate(self, user_input: str) -> str:
         """
         Validate user input and raise if injection detected.
@@ -114,18 +333,12 @@ class PromptGuard:
         if not user_input:
             return ""
 
-        # Escape XML-like tags used in Claude prompt structure
-        sanitized = user_input.replace("<", "&lt;").replace(">", "&gt;")
-
-        # Escape backticks to prevent markdown code block injection
-        sanitized = sanitized.replace("`", "\\`")
-
-        return sanitized
+        return user_input.translate(self._SANITIZE_TABLE)
 
     def build_safe_prompt(
         self,
         user_query: str,
-        documents: list[str],
+        documents: Iterable[str],
         system_instruction: str = "You are a helpful document analysis assistant.",
     ) -> str:
         """
@@ -133,27 +346,72 @@ class PromptGuard:
 
         Args:
             user_query: Validated and sanitized user query
-            documents: List of document contents
+            documents: Document contents; consumed once, so a generator works
             system_instruction: System-level instruction
 
         Returns:
             Structured prompt with injection resistance
         """
-        self.validate(user_query)
+        return self.build_safe_prompt_from_block(
+            user_query=user_query,
+            documents_block=self.build_documents_block(documents),
+            system_instruction=system_instruction,
+        )
 
-        safe_query = self.sanitize(user_query)
-        safe_docs = [self.sanitize(doc) for doc in documents]
+    def build_documents_block(self, documents: Iterable[str]) -> str:
+        """
+        Sanitize and wrap documents into the body of the <documents> section.
 
-        prompt = f"""{system_instruction}
+        The result depends only on the documents, so callers may cache it and
+        reuse it across queries with build_safe_prompt_from_block.
 
-<documents>
-{chr(10).join(f"<document>{doc}</document>" for doc in safe_docs)}
-</documents>
+        Args:
+            documents: Document contents; consumed once, so a generator works
 
-<user_query>
-{safe_query}
-</user_query>
+        Returns:
+            Sanitized <document> elements separated by newlines
+        """
+        buf = io.StringIO()
+
+        # Sanitize and wrap each document straight into the buffer
+        for i, doc in enumerate(documents):
+            if i:
+                buf.write("\n")
+            buf.write("<document>")
+            buf.write(self.sanitize(doc))
+            buf.write("</document>")
+
+        return buf.getvalue()
+
+    def build_safe_prompt_from_block(
+        self,
+        user_query: str,
+        documents_block: str,
+        system_instruction: str = "You are a helpful document analysis assistant.",
+    ) -> str:
+        """
+        Build structured prompt around a prebuilt documents block.
+
+        Args:
+            user_query: Validated and sanitized user query
+            documents_block: Output of build_documents_block
+            system_instruction: System-level instruction
 
-Please analyze the documents above and answer the user's query. Base your response only on the provided documents."""
+        Returns:
+            Structured prompt with injection resistance
+        """
+        self.validate(user_query)
 
-        return prompt
+        buf = io.StringIO()
+        buf.write(system_instruction)
+        buf.write("\n\n<documents>\n")
+        buf.write(documents_block)
+        buf.write("\n</documents>\n\n<user_query>\n")
+        buf.write(self.sanitize(user_query))
+        buf.write(
+            "\n</user_query>\n\n"
+            "Please analyze the documents above and answer the user's query. "
+            "Base your response only on the provided documents."
+        )
+
+        return buf.getvalue()
@@ -1,6 +1,6 @@
 """Temporal activities for document processing, prompts, and LLM streaming."""
 
-from .document_activities import Document, read_document, scan_directory
+from .document_activities import Document, read_document, read_documents, scan_directory
 from .llm_activities import LLMActivities
 from .prompt_activities import build_safe_prompt
 
@@ -10,5 +10,6 @@ __all__ = [
     "LLMActivities",
     "build_safe_prompt",
     "read_document",
+    "read_documents",
     "scan_directory",
 ]
@@ -4,10 +4,35 @@ Temporal activities for LLM interaction.
 Activities signal tokens back to workflow using Temporal's Signal feature.
 """
 
+import asyncio
+import functools
+import time
+from collections.abc import Callable
+
 from temporalio import activity
-from temporalio.client import Client
+from temporalio.client import Client, WorkflowHandle
 
 from backend.llm import BaseLLMAdapter, LLMProviderError, create_llm_adapter
+from backend.temporal.activities.document_activities import Document
+from backend.temporal.activities.prompt_activities import assemble_safe_prompt
+
+
+# Seconds to wait for the error status signal before giving up
+ERROR_SIGNAL_TIMEOUT_SECONDS = 5.0
+
+
+async def _send_status(handle: WorkflowHandle, status: str) -> None:
+    """
+    Signal a status update to the workflow, logging failures.
+
+    Args:
+        handle: Handle of the workflow to signal
+        status: Status message
+    """
+    try:
+        await handle.signal("update_status", status)
+    except Exception as e:
+        activity.logger.warning(f"Failed to send status update: {e}")
 
 
 class LLMActivities:
@@ -39,11 +64,14 @@ class LLMActivities:
         workflow_id: str,
         max_tokens: int = 4096,
         temperature: float = 0.7,
+        streaming: bool = True,
     ) -> dict:
         """
         Stream LLM completion with Temporal signals.
 
-        Tokens are sent back to workflow via signals as they're generated.
+        Tokens are sent back to workflow in batches via the receive_tokens
+        signal, flushed every 32 tokens or 50ms, whichever comes first. With
+        streaming disabled, the full response is sent in a single signal.
         Client polls workflow state via Query to receive tokens.
 
         Args:
@@ -51,6 +79,8 @@ class LLMActivities:
             workflow_id: Workflow ID to send signals to
             max_tokens: Maximum tokens to generate
             temperature: Sampling temperature (0.0 - 1.0)
+            streaming: Signal partial batches while generating (False buffers
+                the whole response and signals it once at completion)
 
         Returns:
             Dict with completion stats (token_count, model, etc.)
@@ -59,14 +89,88 @@ class LLMActivities:
             ValueError: If prompt is empty
             LLMProviderError: If LLM request fails
         """
+        if not prompt or not prompt.strip():
+            raise ValueError("Prompt cannot be empty")
+
+        return await self._stream_to_workflow(
+            lambda: prompt, workflow_id, max_tokens, temperature, streaming
+        )
+
+    @activity.defn
+    async def stream_llm_from_documents(
+        self,
+        documents: list[Document],
+        user_query: str,
+        system_instruction: str | None,
+        max_chars_per_file: int,
+        workflow_id: str,
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+        streaming: bool = True,
+    ) -> dict:
+        """
+        Build the safe prompt from documents and stream the LLM completion.
+
+        The prompt is built here rather than in a separate activity so
+        document contents cross an activity boundary only once. Streaming
+        behaves as in stream_llm_native.
+
+        Args:
+            documents: Documents to include in context (errored ones are skipped)
+            user_query: User's question/query
+            system_instruction: Optional system instruction (uses default if None)
+            max_chars_per_file: Maximum characters per document
+            workflow_id: Workflow ID to send signals to
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature (0.0 - 1.0)
+            streaming: Signal partial batches while generating (False buffers
+                the whole response and signals it once at completion)
+
+        Returns:
+            Dict with completion stats (token_count, model, etc.)
+
+        Raises:
+            PromptInjectionError: If user query contains injection patterns
+            ValueError: If no readable documents were provided
+            LLMProviderError: If LLM request fails
+        """
+        return await self._stream_to_workflow(
+            functools.partial(
+                assemble_safe_prompt, documents, user_query, system_instruction, max_chars_per_file
+            ),
+            workflow_id,
+            max_tokens,
+            temperature,
+            streaming,
+        )
+
+    async def _stream_to_workflow(
+        self,
+        build_prompt: Callable[[], str],
+        workflow_id: str,
+        max_tokens: int,
+        temperature: float,
+        streaming: bool,
+    ) -> dict:
+        """
+        Stream a completion to the workflow as receive_tokens signals.
+
+        Args:
+            build_prompt: Returns the prompt; called inside the error handling so
+                prompt failures are reported to the workflow too
+            workflow_id: Workflow ID to send signals to
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature (0.0 - 1.0)
+            streaming: Signal partial batches while generating
+
+        Returns:
+            Dict with completion stats (token_count, model, etc.)
+        """
         activity.logger.info(
             f"Starting LLM stream to workflow: {workflow_id} "
             f"(provider: {self.llm.provider_name})"
         )
 
-        if not prompt or not prompt.strip():
-            raise ValueError("Prompt cannot be empty")
-
         if self.client is None:
             raise RuntimeError(
                 "Temporal client not available. "
@@ -76,44 +180,59 @@ class LLMActivities:
         token_count = 0
         finish_reason = None
         batch = []
-        batch_size = 5  # Batch tokens to reduce signal overhead
+        batch_size = 32  # Batch tokens to reduce signal overhead (power of two)
+        batch_mask = batch_size - 1
+        flush_interval = 0.05  # Bound first-token latency while batching
+        last_flush = time.monotonic()
+        # Latest in-flight status signal; kept local since activities share self
+        status_task = None
+
+        handle = self.client.get_workflow_handle(workflow_id)
+
+        # Bind hot-loop callables to locals to skip attribute lookups per token
+        append = batch.append
+        signal = handle.signal
+        heartbeat = activity.heartbeat
+        monotonic = time.monotonic
 
         try:
-            handle = self.client.get_workflow_handle(workflow_id)
+            prompt = build_prompt()
 
             async for chunk in self.llm.stream_completion(
                 prompt=prompt,
                 max_tokens=max_tokens,
                 temperature=temperature,
             ):
-                batch.append(chunk.content)
+                append(chunk.content)
                 token_count += 1
 
-                if len(batch) >= batch_size:
-                    for token in batch:
-                        await handle.signal("receive_token", token)
+                if streaming and (
+                    not (token_count & batch_mask) or monotonic() - last_flush >= flush_interval
+                ):
+                    await signal("receive_tokens", batch)
                     batch = []
+                    append = batch.append
+                    last_flush = monotonic()
 
-                # Heartbeat every 20 tokens to keep activity alive
-                if token_count % 20 == 0:
-                    activity.heartbeat(f"Streamed {token_count} tokens")
+                # Heartbeat every 16 tokens to keep activity alive
+                if not (token_count & 15):
+                    heartbeat(f"Streamed {token_count} tokens")
 
-                # Send status update every 50 tokens for UI feedback
-                if token_count % 50 == 0:
-                    try:
-                        await handle.signal(
-                            "update_status",
-                            f"Generating response... ({token_count} tokens)"
-                        )
-                    except Exception as e:
-                        activity.logger.warning(f"Failed to send status update: {e}")
+                # Send status update every 64 tokens for UI feedback, without blocking
+                # the stream; a newer status supersedes one still in flight
+                if not (token_count & 63):
+                    if status_task is not None:
+                        status_task.cancel()
+                    status_task = asyncio.create_task(
+                        _send_status(handle, f"Generating response... ({token_count} tokens)")
+                    )
 
-                if chunk.finish_reason:
-                    finish_reason = chunk.finish_reason
+                chunk_finish_reason = chunk.finish_reason
+                if chunk_finish_reason:
+                    finish_reason = chunk_finish_reason
 
             if batch:
-                for token in batch:
-                    await handle.signal("receive_token", token)
+                await signal("receive_tokens", batch)
 
             activity.logger.info(
                 f"Completed streaming: {token_count} tokens, "
@@ -130,10 +249,19 @@ class LLMActivities:
         except Exception as e:
             activity.logger.error(f"LLM streaming error: {e}")
 
-            # Best effort to signal error back to workflow
+            # Best effort to signal error back to workflow, bounded in case the
+            # connection to Temporal is what failed
             try:
-                await handle.signal("update_status", f"Error: {e}")
+                await asyncio.wait_for(
+                    handle.signal("update_status", f"Error: {e}"),
+                    timeout=ERROR_SIGNAL_TIMEOUT_SECONDS,
+                )
             except Exception:
                 pass
 
             raise
+
+        finally:
+            # A late progress update must not overwrite the workflow's final status
+            if status_task is not None:
+                status_task.cancel()
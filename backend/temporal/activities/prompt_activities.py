@@ -4,12 +4,33 @@ Temporal activities for prompt building and validation.
 These activities handle prompt construction with injection protection.
 """
 
+import threading
+from collections import OrderedDict
+from collections.abc import Iterator
+
 from temporalio import activity
 
 from backend.security import PromptGuard, PromptInjectionError
 from backend.temporal.activities.document_activities import Document
 
 
+# Template for each document block in the prompt
+_DOC_TEMPLATE = (
+    '<document path="{path}" filename="{filename}" type="{file_type}">\n{content}{tail}</document>'
+)
+
+# Block tails for complete and truncated documents
+_DOC_TAIL = "\n"
+_DOC_TAIL_TRUNCATED = "\n\n[Document truncated...]\n"
+
+# Maximum number of sanitized documents blocks kept per worker process
+MAX_PROMPT_CACHE = 16
+
+# Sanitized documents blocks keyed by the per-file limit and the (truncated) documents
+_PROMPT_CACHE: OrderedDict[tuple, str] = OrderedDict()
+_prompt_cache_lock = threading.Lock()
+
+
 @activity.defn
 async def build_safe_prompt(
     documents: list[Document],
@@ -20,6 +41,36 @@ async def build_safe_prompt(
     """
     Build safe, structured prompt with injection protection.
 
+    The chat workflow now builds the prompt inside stream_llm_from_documents;
+    this activity remains for workflows started before that change.
+
+    Args:
+        documents: List of Document objects to include in context
+        user_query: User's question/query
+        system_instruction: Optional system instruction (uses default if None)
+        max_chars_per_file: Maximum characters per document (default: 2000)
+
+    Returns:
+        Structured prompt with clear boundaries
+
+    Raises:
+        PromptInjectionError: If user query contains injection patterns
+    """
+    return assemble_safe_prompt(documents, user_query, system_instruction, max_chars_per_file)
+
+
+def assemble_safe_prompt(
+    documents: list[Document],
+    user_query: str,
+    system_instruction: str = None,
+    max_chars_per_file: int = 2000,
+) -> str:
+    """
+    Build safe, structured prompt with injection protection.
+
+    Plain function so activities can build the prompt in-process instead of
+    shipping documents through another activity.
+
     Args:
         documents: List of Document objects to include in context
         user_query: User's question/query
@@ -31,6 +82,7 @@ async def build_safe_prompt(
 
     Raises:
         PromptInjectionError: If user query contains injection patterns
+        ValueError: If no document is free of read errors
     """
     activity.logger.info(f"Building prompt for query: {user_query[:100]}...")
 
@@ -60,25 +112,107 @@ async def build_safe_prompt(
         activity.logger.error("No valid documents to analyze")
         raise ValueError("No valid documents available for analysis")
 
-    doc_contexts = []
-    for doc in valid_documents:
-        # Truncate documents to manage token budget
-        content = doc.content[:max_chars_per_file]
-        if len(doc.content) > max_chars_per_file:
-            content += "\n\n[Document truncated...]"
-
-        doc_contexts.append(
-            f'<document path="{doc.path}" filename="{doc.filename}" type="{doc.file_type}">\n'
-            f"{content}\n"
-            f"</document>"
+    # The documents block dominates prompt size and does not depend on the query,
+    # so retries and follow-up questions over the same documents reuse it
+    cache_key = _documents_cache_key(valid_documents, max_chars_per_file)
+    documents_block = _get_cached_block(cache_key)
+    if documents_block is None:
+        documents_block = guard.build_documents_block(
+            _iter_document_blocks(valid_documents, max_chars_per_file)
         )
+        _store_cached_block(cache_key, documents_block)
 
-    prompt = guard.build_safe_prompt(
+    prompt = guard.build_safe_prompt_from_block(
         user_query=user_query,
-        documents=doc_contexts,
+        documents_block=documents_block,
         system_instruction=system_instruction,
     )
 
     activity.logger.info(f"Built prompt: {len(valid_documents)} docs, {len(prompt)} chars total")
 
     return prompt
+
+
+def _iter_document_blocks(documents: list[Document], max_chars_per_file: int) -> Iterator[str]:
+    """
+    Yield one <document> block per document, truncated to the token budget.
+
+    Blocks are produced lazily so PromptGuard writes each one straight into
+    its output buffer without an intermediate list.
+
+    Args:
+        documents: Documents to include in context
+        max_chars_per_file: Maximum characters per document
+
+    Yields:
+        Formatted document block
+    """
+    render = _DOC_TEMPLATE.format
+
+    for doc in documents:
+        # Truncate documents to manage token budget, slicing only when needed
+        content = doc.content
+        truncated = len(content) > max_chars_per_file
+        if truncated:
+            content = content[:max_chars_per_file]
+
+        yield render(
+            path=doc.path,
+            filename=doc.filename,
+            file_type=doc.file_type,
+            content=content,
+            tail=_DOC_TAIL_TRUNCATED if truncated else _DOC_TAIL,
+        )
+
+
+def _documents_cache_key(documents: list[Document], max_chars_per_file: int) -> tuple:
+    """
+    Build the cache key for a documents block.
+
+    Only the first max_chars_per_file + 1 characters of each document are
+    used: that is all the block depends on, and it keeps the key small.
+
+    Args:
+        documents: Documents included in the prompt, in prompt order
+        max_chars_per_file: Maximum characters per document
+
+    Returns:
+        Hashable key identifying the rendered documents block
+    """
+    limit = max_chars_per_file + 1
+    return (
+        max_chars_per_file,
+        tuple((doc.path, doc.filename, doc.file_type, doc.content[:limit]) for doc in documents),
+    )
+
+
+def _get_cached_block(key: tuple) -> str | None:
+    """
+    Get a previously built documents block.
+
+    Args:
+        key: Key from _documents_cache_key
+
+    Returns:
+        Documents block, or None if not cached
+    """
+    with _prompt_cache_lock:
+        block = _PROMPT_CACHE.get(key)
+        if block is not None:
+            _PROMPT_CACHE.move_to_end(key)
+        return block
+
+
+def _store_cached_block(key: tuple, block: str) -> None:
+    """
+    Cache a documents block, evicting the least recently used entry.
+
+    Args:
+        key: Key from _documents_cache_key
+        block: Documents block built by PromptGuard.build_documents_block
+    """
+    with _prompt_cache_lock:
+        _PROMPT_CACHE[key] = block
+        _PROMPT_CACHE.move_to_end(key)
+        if len(_PROMPT_CACHE) > MAX_PROMPT_CACHE:
+            _PROMPT_CACHE.popitem(last=False)
@@ -0,0 +1,64 @@
+"""
+msgspec-backed data converter for Temporal payloads.
+
+Replaces the SDK's stdlib-json "json/plain" converter with msgspec, which
+encodes and decodes dataclasses and msgspec Structs natively. The wire format
+stays plain JSON, so clients using the default converter remain compatible.
+"""
+
+from typing import Any
+
+import msgspec
+from temporalio.api.common.v1 import Payload
+from temporalio.converter import (
+    CompositePayloadConverter,
+    DataConverter,
+    DefaultPayloadConverter,
+    EncodingPayloadConverter,
+    JSONPlainPayloadConverter,
+)
+
+
+class MsgspecJSONPayloadConverter(EncodingPayloadConverter):
+    """Converter for 'json/plain' payloads using msgspec."""
+
+    @property
+    def encoding(self) -> str:
+        """See base class."""
+        return "json/plain"
+
+    def to_payload(self, value: Any) -> Payload | None:
+        """See base class."""
+        # Encoding errors propagate to the caller, as with the default converter
+        return Payload(
+            metadata={"encoding": b"json/plain"},
+            data=msgspec.json.encode(value),
+        )
+
+    def from_payload(self, payload: Payload, type_hint: type | None = None) -> Any:
+        """See base class."""
+        try:
+            if type_hint is None:
+                return msgspec.json.decode(payload.data)
+            return msgspec.json.decode(payload.data, type=type_hint)
+        except msgspec.DecodeError as err:
+            raise RuntimeError("Failed parsing") from err
+
+
+class MsgspecPayloadConverter(CompositePayloadConverter):
+    """Default payload converters with msgspec handling 'json/plain'."""
+
+    def __init__(self) -> None:
+        """Initialize with the SDK defaults, swapping in the msgspec JSON converter."""
+        super().__init__(
+            *(
+                MsgspecJSONPayloadConverter()
+                if isinstance(converter, JSONPlainPayloadConverter)
+                else converter
+                for converter in DefaultPayloadConverter.default_encoding_payload_converters
+            )
+        )
+
+
+# Pass to Client.connect(data_converter=...) on every client that talks to the worker
+msgspec_data_converter = DataConverter(payload_converter_class=MsgspecPayloadConverter)
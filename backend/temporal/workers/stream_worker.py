@@ -11,6 +11,12 @@ import asyncio
 import logging
 import os
 
+# Pay the import cost of the HTTP/LLM SDK stack at worker start rather than on the
+# first activity (httpcore only imports anyio once the first request is made)
+import anthropic  # noqa: F401
+import anyio  # noqa: F401
+import httpx  # noqa: F401
+import openai  # noqa: F401
 from temporalio.client import Client
 from temporalio.worker import Worker
 from temporalio.worker.workflow_sandbox import SandboxedWorkflowRunner, SandboxRestrictions
@@ -19,10 +25,12 @@ from backend.llm import create_llm_adapter
 # Import activities directly to avoid triggering __init__.py which imports httpx (blocked by Temporal sandbox)
 from backend.temporal.activities.document_activities import (
     read_document,
+    read_documents,
     scan_directory,
 )
 from backend.temporal.activities.prompt_activities import build_safe_prompt
 from backend.temporal.activities.llm_activities import LLMActivities
+from backend.temporal.converter import msgspec_data_converter
 from backend.temporal.workflows import LLMChatWorkflow
 
 
@@ -33,6 +41,30 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Allow httpx in sandbox - it's only used in activities, not workflows.
+# Built once at import so worker startup only has to connect.
+SANDBOX_RESTRICTIONS = SandboxRestrictions.default.with_passthrough_modules(
+    # HTTP clients and related modules
+    "httpx",
+    "httpcore",
+    "urllib.request",
+    "urllib3",
+    "ssl",
+    "h11",
+    # Async libraries used by AI SDKs
+    "anyio",
+    "sniffio",
+    # AI SDK modules (only used in activities, not workflows)
+    "openai",
+    "anthropic",
+    # Payload serialization (Document is a msgspec Struct)
+    "msgspec",
+    # PDF extraction; heavy to import and only used in activities
+    "pymupdf",
+    # Imported via document_activities; deterministic and stateless per import
+    "backend.security",
+)
+
 
 async def main():
     """Run the Temporal worker."""
@@ -62,6 +94,7 @@ async def main():
         temporal_client = await Client.connect(
             temporal_address,
             namespace=temporal_namespace,
+            data_converter=msgspec_data_converter,
         )
         logger.info("✓ Temporal connection successful")
     except Exception as e:
@@ -73,25 +106,8 @@ async def main():
         temporal_client=temporal_client,
     )
 
-    # Allow httpx in sandbox - it's only used in activities, not workflows
     logger.info(f"Creating worker on task queue: {task_queue}")
 
-    custom_restrictions = SandboxRestrictions.default.with_passthrough_modules(
-        # HTTP clients and related modules
-        "httpx",
-        "httpcore",
-        "urllib.request",
-        "urllib3",
-        "ssl",
-        "h11",
-        # Async libraries used by AI SDKs
-        "anyio",
-        "sniffio",
-        # AI SDK modules (only used in activities, not workflows)
-        "openai",
-        "anthropic",
-    )
-
     worker = Worker(
         temporal_client,
         task_queue=task_queue,
@@ -100,12 +116,14 @@ async def main():
             # Document activities
             scan_directory,
             read_document,
+            read_documents,
             # Prompt activities
             build_safe_prompt,
             # LLM activities
             llm_activities.stream_llm_native,
+            llm_activities.stream_llm_from_documents,
         ],
-        workflow_runner=SandboxedWorkflowRunner(restrictions=custom_restrictions),
+        workflow_runner=SandboxedWorkflowRunner(restrictions=SANDBOX_RESTRICTIONS),
     )
 
     logger.info("=" * 60)
@@ -1,6 +1,12 @@
 """Temporal workflows."""
 
-from .llm_chat_workflow import ChatRequest, ChatResult, LLMChatWorkflow, StreamState
+from .llm_chat_workflow import (
+    ChatRequest,
+    ChatResult,
+    LLMChatWorkflow,
+    StreamState,
+    StreamUpdate,
+)
 
 
 __all__ = [
@@ -8,4 +14,5 @@ __all__ = [
     "ChatResult",
     "LLMChatWorkflow",
     "StreamState",
+    "StreamUpdate",
 ]
@@ -6,15 +6,19 @@ Activities signal tokens back to workflow, clients poll workflow state via Query
 """
 
 import asyncio
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from datetime import timedelta
 from typing import List, Optional
 
 from temporalio import workflow
 from temporalio.common import RetryPolicy
 
-# Import directly to avoid triggering LLMActivities which uses httpx (blocked by Temporal sandbox)
-from backend.temporal.activities.document_activities import Document
+
+# Import directly to avoid triggering LLMActivities which uses httpx (blocked by Temporal sandbox).
+# Passed through so the document-processing stack (PyMuPDF, pypdf, chardet, ...) is
+# imported once by the worker rather than re-imported in every workflow sandbox.
+with workflow.unsafe.imports_passed_through():
+    from backend.temporal.activities.document_activities import Document
 
 
 @dataclass
@@ -28,6 +32,7 @@ class ChatRequest:
     max_chars_per_file: int = 2000  # Limit chars per file to manage token budget
     llm_max_tokens: int = 4096
     llm_temperature: float = 0.7
+    streaming: bool = True  # False delivers the whole response in one signal at the end
 
 
 @dataclass
@@ -46,7 +51,8 @@ class ChatResult:
 class StreamState:
     """Current state of the stream for client polling."""
 
-    tokens: List[str] = field(default_factory=list)
+    text: str = ""  # Response generated so far; offsets index into this string
+    token_count: int = 0
     status: str = "initializing"
     completed: bool = False
     error: Optional[str] = None
@@ -54,6 +60,17 @@ class StreamState:
     files_processed: int = 0
 
 
+@dataclass
+class StreamUpdate:
+    """Incremental stream state returned to clients that track an offset."""
+
+    text: str = ""
+    next_offset: int = 0
+    status: str = "initializing"
+    completed: bool = False
+    error: Optional[str] = None
+
+
 @workflow.defn
 class LLMChatWorkflow:
     """
@@ -61,14 +78,13 @@ class LLMChatWorkflow:
 
     Flow:
     1. Scan directory for documents
-    2. Read documents in parallel
-    3. Build safe prompt
-    4. Stream LLM response (activity signals tokens back)
-    5. Expose state via Query for client polling
+    2. Read documents in parallel (single batched activity)
+    3. Build safe prompt and stream LLM response (activity signals tokens back)
+    4. Expose state via Query for client polling
 
     Streaming:
-    - Activity signals tokens via 'receive_token' signal
-    - Client polls 'get_stream_state' query every 100-200ms
+    - Activity signals token batches via 'receive_tokens' signal
+    - Client polls 'get_stream_update' query every 100-200ms with its offset
     """
 
     def __init__(self):
@@ -80,12 +96,25 @@ class LLMChatWorkflow:
         """
         Receive a token from the LLM activity.
 
-        Called by activity as it streams tokens.
+        Kept for compatibility with activities that signal one token at a time.
 
         Args:
             token: Single token from LLM
         """
-        self.state.tokens.append(token)
+        await self.receive_tokens([token])
+
+    @workflow.signal
+    async def receive_tokens(self, tokens: List[str]) -> None:
+        """
+        Receive a batch of tokens from the LLM activity.
+
+        Called by activity as it streams tokens.
+
+        Args:
+            tokens: Tokens from LLM, in generation order
+        """
+        self.state.text += "".join(tokens)
+        self.state.token_count += len(tokens)
 
     @workflow.signal
     async def update_status(self, status: str) -> None:
@@ -110,19 +139,52 @@ class LLMChatWorkflow:
         return self.state
 
     @workflow.query
-    def get_tokens_since(self, index: int) -> List[str]:
+    def get_tokens_since(self, index: int) -> str:
         """
-        Get tokens since a specific index.
+        Get text generated since a specific character offset.
 
         More efficient for clients that track their position.
 
         Args:
-            index: Starting index (exclusive)
+            index: Character offset already received
+
+        Returns:
+            Text from index to current
+        """
+        return self.state.text[index:]
+
+    @workflow.query
+    def get_next_offset(self) -> int:
+        """
+        Get the offset a client should pass to receive only future text.
 
         Returns:
-            List of tokens from index to current
+            Number of characters received so far
         """
-        return self.state.tokens[index:]
+        return len(self.state.text)
+
+    @workflow.query
+    def get_stream_update(self, offset: int) -> StreamUpdate:
+        """
+        Get text received since offset along with the current status.
+
+        Only the new text is serialized, so each poll costs O(new text)
+        instead of re-sending the whole transcript.
+
+        Args:
+            offset: Value of next_offset from the previous update (0 initially)
+
+        Returns:
+            StreamUpdate with new text and the character offset for the next poll
+        """
+        text = self.state.text
+        return StreamUpdate(
+            text=text[offset:],
+            next_offset=len(text),
+            status=self.state.status,
+            completed=self.state.completed,
+            error=self.state.error,
+        )
 
     @workflow.run
     async def run(self, request: ChatRequest) -> ChatResult:
@@ -177,20 +239,28 @@ class LLMChatWorkflow:
             self.state.status = f"Reading {len(file_paths)} files..."
             workflow.logger.info("Reading documents")
 
-            read_tasks = [
-                workflow.execute_activity(
-                    "read_document",
-                    args=[file_path, request.max_file_size_mb],
+            # Histories recorded before batching scheduled one read_document per
+            # file; the patch marker keeps them replaying on that path
+            if workflow.patched("batched-read-documents"):
+                documents = await workflow.execute_activity(
+                    "read_documents",
+                    args=[file_paths, request.max_file_size_mb],
                     start_to_close_timeout=timedelta(seconds=120),
                     retry_policy=RetryPolicy(maximum_attempts=2),
+                    result_type=list[Document],
                 )
-                for file_path in file_paths
-            ]
-
-            documents_raw = await asyncio.gather(*read_tasks)
-            documents = [
-                Document(**doc) if isinstance(doc, dict) else doc for doc in documents_raw
-            ]
+            else:
+                read_tasks = [
+                    workflow.execute_activity(
+                        "read_document",
+                        args=[file_path, request.max_file_size_mb],
+                        start_to_close_timeout=timedelta(seconds=120),
+                        retry_policy=RetryPolicy(maximum_attempts=2),
+                        result_type=Document,
+                    )
+                    for file_path in file_paths
+                ]
+                documents = await asyncio.gather(*read_tasks)
             valid_docs = [doc for doc in documents if not doc.error]
 
             self.state.files_processed = len(valid_docs)
@@ -210,31 +280,56 @@ class LLMChatWorkflow:
                     error="Failed to read any documents",
                 )
 
-            self.state.status = "Building prompt..."
-            workflow.logger.info("Building prompt")
+            # Histories recorded before the fused activity ran build_safe_prompt
+            # separately; the patch marker keeps them replaying on that path
+            if workflow.patched("fused-prompt-build"):
+                self.state.status = "Generating response..."
+                workflow.logger.info("Streaming LLM response")
+
+                # Prompt is built inside the activity so documents are shipped only once
+                llm_result = await workflow.execute_activity(
+                    "stream_llm_from_documents",
+                    args=[
+                        valid_docs,
+                        request.user_query,
+                        None,
+                        request.max_chars_per_file,
+                        workflow_id,
+                        request.llm_max_tokens,
+                        request.llm_temperature,
+                        request.streaming,
+                    ],
+                    start_to_close_timeout=timedelta(minutes=10),
+                    heartbeat_timeout=timedelta(seconds=30),
+                    retry_policy=RetryPolicy(maximum_attempts=2),
+                )
+            else:
+                self.state.status = "Building prompt..."
+                workflow.logger.info("Building prompt")
 
-            prompt = await workflow.execute_activity(
-                "build_safe_prompt",
-                args=[valid_docs, request.user_query, None, request.max_chars_per_file],
-                start_to_close_timeout=timedelta(seconds=30),
-                retry_policy=RetryPolicy(maximum_attempts=2),
-            )
+                prompt = await workflow.execute_activity(
+                    "build_safe_prompt",
+                    args=[valid_docs, request.user_query, None, request.max_chars_per_file],
+                    start_to_close_timeout=timedelta(seconds=30),
+                    retry_policy=RetryPolicy(maximum_attempts=2),
+                )
 
-            self.state.status = "Generating response..."
-            workflow.logger.info("Streaming LLM response")
-
-            llm_result = await workflow.execute_activity(
-                "stream_llm_native",
-                args=[
-                    prompt,
-                    workflow_id,
-                    request.llm_max_tokens,
-                    request.llm_temperature,
-                ],
-                start_to_close_timeout=timedelta(minutes=10),
-                heartbeat_timeout=timedelta(seconds=30),
-                retry_policy=RetryPolicy(maximum_attempts=2),
-            )
+                self.state.status = "Generating response..."
+                workflow.logger.info("Streaming LLM response")
+
+                llm_result = await workflow.execute_activity(
+                    "stream_llm_native",
+                    args=[
+                        prompt,
+                        workflow_id,
+                        request.llm_max_tokens,
+                        request.llm_temperature,
+                        request.streaming,
+                    ],
+                    start_to_close_timeout=timedelta(minutes=10),
+                    heartbeat_timeout=timedelta(seconds=30),
+                    retry_policy=RetryPolicy(maximum_attempts=2),
+                )
 
             self.state.completed = True
             self.state.status = "Completed"
@@ -257,26 +352,15 @@ class LLMChatWorkflow:
 
             workflow.logger.error(f"Workflow error: {error_message}")
 
-            if isinstance(self.state, dict):
-                self.state["error"] = error_message
-                self.state["completed"] = True
-                self.state["status"] = f"Failed: {error_message}"
-                files_found = self.state.get("files_found", 0)
-                files_processed = self.state.get("files_processed", 0)
-                token_count = len(self.state.get("tokens", []))
-            else:
-                self.state.error = error_message
-                self.state.completed = True
-                self.state.status = f"Failed: {error_message}"
-                files_found = self.state.files_found
-                files_processed = self.state.files_processed
-                token_count = len(self.state.tokens)
+            self.state.error = error_message
+            self.state.completed = True
+            self.state.status = f"Failed: {error_message}"
 
             return ChatResult(
                 success=False,
-                files_found=files_found,
-                files_processed=files_processed,
-                token_count=token_count,
+                files_found=self.state.files_found,
+                files_processed=self.state.files_processed,
+                token_count=self.state.token_count,
                 model="",
                 error=error_message,
             )